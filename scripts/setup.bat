@@ -0,0 +1,17 @@
+@echo off
+echo Setting up MCP Server project...
+
+echo Installing dependencies...
+pip install -r requirements.txt
+
+echo Running tests...
+python src/tests/test_calculator.py
+
+echo Setup complete!
+echo.
+echo To run the MCP server:
+echo python src/server/app.py
+echo.
+echo MCP server will be available at: http://localhost:8001/mcp
+echo Test with MCP Inspector: npx @modelcontextprotocol/inspector@latest http://localhost:8001/mcp
+pause
\ No newline at end of file
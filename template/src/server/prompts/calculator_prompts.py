@@ -0,0 +1,100 @@
+"""
+Calculator Prompts Module
+
+Provides conversation templates and user interaction messages.
+"""
+
+from fastmcp import FastMCP
+
+calculator_prompts = FastMCP("Calculator Prompts")
+
+@calculator_prompts.prompt("welcome")
+def welcome_prompt(user_name: str = "User"):
+    """Generate a friendly welcome message for new users."""
+    return f"""Hello {user_name}! Welcome to the Calculator MCP Server.
+
+I can help you with basic arithmetic operations:
+- Addition: add(a, b)
+- Subtraction: subtract(a, b)
+
+Try asking me to add or subtract some numbers!
+
+Example: "Can you add 15 and 27?"
+    """
+
+@calculator_prompts.prompt("help")
+def help_prompt(operation: str = ""):
+    """Provide detailed help and usage instructions."""
+    if operation == "add":
+        return """Addition Help:
+
+Usage: add(a, b)
+- a: First number (any integer or decimal)
+- b: Second number (any integer or decimal)
+- Returns: Sum of a and b
+
+Examples:
+- add(5, 3) = 8
+- add(2.5, 1.5) = 4.0
+- add(-3, 7) = 4
+        """
+    elif operation == "subtract":
+        return """Subtraction Help:
+
+Usage: subtract(a, b)
+- a: First number (minuend)
+- b: Second number (subtrahend)
+- Returns: Difference of a - b
+
+Examples:
+- subtract(10, 3) = 7
+- subtract(5.5, 2.5) = 3.0
+- subtract(2, 8) = -6
+        """
+    else:
+        return """Calculator Help:
+
+Available commands:
+1. add(a, b) - Add two numbers
+2. subtract(a, b) - Subtract second from first
+
+For specific help on any operation, ask:
+"Help me with addition" or "Help me with subtraction"
+
+All operations work with integers and decimals.
+        """
+
+@calculator_prompts.prompt("error")
+def error_prompt(error_type: str = "general", details: str = ""):
+    """Create user-friendly error messages when things go wrong."""
+    if error_type == "invalid_input":
+        return f"""Oops! There was an issue with your input.
+
+Problem: {details}
+
+Please make sure you're using numbers only.
+
+Examples of correct usage:
+- add(5, 3)
+- subtract(10.5, 2.3)
+
+Try again with valid numbers!
+        """
+    elif error_type == "missing_parameters":
+        return """Missing Parameters!
+
+Calculator operations need two numbers.
+
+Correct format:
+- add(first_number, second_number)
+- subtract(first_number, second_number)
+
+Example: add(5, 3)
+        """
+    else:
+        return f"""Something went wrong!
+
+{details if details else "An unexpected error occurred."}
+
+Please try again or ask for help if the problem persists.
+        """
\ No newline at end of file
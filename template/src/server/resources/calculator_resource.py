@@ -0,0 +1,54 @@
+"""
+Calculator Resources Module
+
+Provides information and help content for calculator tools.
+"""
+
+from fastmcp import FastMCP
+
+calculator_resources = FastMCP("Calculator Resources")
+
+@calculator_resources.resource("file://calculator/help")
+def calculator_help():
+    """Provides comprehensive help information about calculator tools."""
+    return {
+        "type": "text",
+        "content": """Calculator Help
+
+Available Operations:
+- add(a, b): Add two numbers together
+- subtract(a, b): Subtract second number from first
+
+Examples:
+- add(5, 3) returns 8
+- subtract(10, 4) returns 6
+
+All operations support both integers and floating-point numbers.
+        """
+    }
+
+@calculator_resources.resource("file://calculator/operations")
+def calculator_operations():
+    """Lists all available calculator operations with details."""
+    return {
+        "type": "json",
+        "content": {
+            "operations": [
+                {
+                    "name": "add",
+                    "description": "Addition operation",
+                    "parameters": ["a: number", "b: number"],
+                    "return_type": "number",
+                    "example": "add(5, 3) → 8"
+                },
+                {
+                    "name": "subtract",
+                    "description": "Subtraction operation",
+                    "parameters": ["a: number", "b: number"],
+                    "return_type": "number",
+                    "example": "subtract(10, 4) → 6"
+                }
+            ],
+            "total_operations": 2
+        }
+    }
\ No newline at end of file
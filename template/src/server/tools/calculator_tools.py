@@ -0,0 +1,39 @@
+"""
+Calculator Tools Module
+
+Contains basic arithmetic operations for demonstration.
+"""
+
+from fastmcp import FastMCP
+
+calculator_mcp = FastMCP("Calculator Tools")
+
+@calculator_mcp.tool
+def add(a: float, b: float) -> float:
+    """Add two numbers together.
+
+    Args:
+        a: First number
+        b: Second number
+
+    Returns:
+        Sum of a and b
+    """
+    result = a + b
+    print(f"Adding {a} + {b} = {result}")
+    return result
+
+@calculator_mcp.tool
+def subtract(a: float, b: float) -> float:
+    """Subtract second number from first number.
+
+    Args:
+        a: First number (minuend)
+        b: Second number (subtrahend)
+
+    Returns:
+        Difference of a - b
+    """
+    result = a - b
+    print(f"Subtracting {a} - {b} = {result}")
+    return result
\ No newline at end of file